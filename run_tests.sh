@@ -5,8 +5,14 @@
 
 GODOT_PATH="/mnt/d/Godot/Godot_v4.4.1-stable_mono_win64.exe"
 
-echo "正在导入资源并缓存类..."
-"$GODOT_PATH" --path . --import
+# 导入会单独启动一次Godot进程，只在全局类缓存缺失或比某个.gd脚本旧时才执行
+# 需要强制重新导入（如只改了资源文件）时，用 FORCE_IMPORT=1 ./run_tests.sh
+CLASS_CACHE=".godot/global_script_class_cache.cfg"
+if [ "$FORCE_IMPORT" = "1" ] || [ ! -f "$CLASS_CACHE" ] || \
+   [ -n "$(find . -path ./.godot -prune -o -name '*.gd' -newer "$CLASS_CACHE" -print -quit)" ]; then
+    echo "正在导入资源并缓存类..."
+    "$GODOT_PATH" --path . --import
+fi
 
 echo "运行所有测试..."
 "$GODOT_PATH" --path . --script addons/gut/gut_cmdln.gd -gdir=tests/gdscript
\ No newline at end of file
@@ -51,6 +51,12 @@ var _exiting = false
 # 测试数据
 var character_names = ["张飞", "关羽", "刘备", "曹操", "孙权"]
 
+# 上次刷新日历相关标签时的日历版本，版本未变时跳过重建标签文本
+var _last_calendar_version: int = -1
+
+# 按颜色缓存的样式盒，CTB队列每次刷新都会为每一项设置样式，颜色种类有限，复用同一个StyleBoxFlat
+var _style_box_cache: Dictionary = {}
+
 func _ready():
     print("Initializing GDScript Integrated System Test (Static UI)")
     
@@ -161,7 +167,12 @@ func _on_ctb_all_animations_finished():
     print("All CTB animations finished")
 
 
+## 返回指定颜色的样式盒。结果按颜色缓存并在多个控件间共享，调用方不应修改返回的对象
 func create_colored_style_box(color: Color) -> StyleBoxFlat:
+    var cached = _style_box_cache.get(color)
+    if cached != null:
+        return cached
+
     var style_box = StyleBoxFlat.new()
     style_box.bg_color = color
     style_box.border_width_top = 1
@@ -177,6 +188,7 @@ func create_colored_style_box(color: Color) -> StyleBoxFlat:
     style_box.content_margin_bottom = 8
     style_box.content_margin_left = 12
     style_box.content_margin_right = 12
+    _style_box_cache[color] = style_box
     return style_box
 
 
@@ -291,15 +303,12 @@ func on_clear_all():
     add_ctb_log_entry("所有事件已清空", false)
     update_all_displays()  # 更新显示
 
-func update_ctb_queue():
+func update_ctb_queue(upcoming_events: Array):
     if not animated_ctb_list or _updating_ctb or _exiting:
         return
     
     _updating_ctb = true
     
-    # 获取即将到来的事件
-    var upcoming_events = test_world.get_upcoming_events(15, 180*24)
-    
     if upcoming_events.size() == 0:
         # 清空所有项目并添加"暂无事件"提示
         animated_ctb_list.clear_all_items()
@@ -338,8 +347,9 @@ func update_ctb_queue():
         animated_ctb_list.update_items_from_data(event_data_array)
         
         # 为新项目创建UI控件，为现有项目更新显示
-        for item in animated_ctb_list.items:
-            var position_index = animated_ctb_list.items.find(item)
+        var items = animated_ctb_list.items
+        for position_index in range(items.size()):
+            var item = items[position_index]
             if item.get_child_count() == 0:  # 新项目没有子控件
                 var event_data = item.get_data()
                 var control = create_ctb_item_control(event_data, position_index)
@@ -459,10 +469,16 @@ func scroll_ctb_to_bottom():
     ctb_scroll_container.scroll_vertical = int(ctb_scroll_container.get_v_scroll_bar().max_value)
 
 func update_all_displays():
-    update_time_display()
-    update_calendar_status()
-    update_time_wheel_inspector()
-    update_ctb_queue()
+    # 日历状态没有变化（如只添加或执行了事件）时，时间和日历标签保持原样
+    var calendar_version = test_world.calendar.get_version()
+    if calendar_version != _last_calendar_version:
+        update_time_display()
+        update_calendar_status()
+        _last_calendar_version = calendar_version
+    # 即将到来的事件只查询一次，时间轮检视器和CTB队列共用
+    var upcoming_events = test_world.get_upcoming_events(15, 180 * 24)
+    update_time_wheel_inspector(upcoming_events)
+    update_ctb_queue(upcoming_events)
 
 func update_time_display():
     var gregorian_time = test_world.current_calendar_time
@@ -471,50 +487,62 @@ func update_time_display():
     current_time_label.text = "📅 %s\n🌍 %s\n⏰ 总计: %d小时" % [era_time, gregorian_time, current_time]
 
 func update_calendar_status():
-    var time_info = test_world.get_calendar_info()
-    var status_text = "公历年份: %s\n" % time_info["gregorian_year"]
-    status_text += "月份: %s, 日期: %s\n" % [time_info["month"], time_info["day_in_month"]]
-    status_text += "年内第 %s 天\n" % time_info["day_in_year"]
-    status_text += "当前纪年: %s\n" % (time_info["current_era_name"] if time_info["current_era_name"] else "无")
-
-    if time_info.has("current_anchor") and time_info["current_anchor"] != null:
-        var anchor = time_info["current_anchor"]
-        if anchor.size() >= 2:
-            status_text += "锚定: %s元年 = 公元%s年" % [anchor[0], anchor[1]]
+    # 直接读取日历的字段访问器，不必每次刷新都构造get_time_info()的字典
+    var calendar = test_world.calendar
+    var status_text = "公历年份: %s\n" % calendar.current_gregorian_year
+    status_text += "月份: %s, 日期: %s\n" % [calendar.current_month, calendar.current_day_in_month]
+    status_text += "年内第 %s 天\n" % calendar.current_day_in_year
+    var era_name = calendar.current_era_name
+    status_text += "当前纪年: %s\n" % (era_name if not era_name.is_empty() else "无")
+
+    var anchor = calendar.current_anchor
+    if anchor.size() >= 2:
+        status_text += "锚定: %s元年 = 公元%s年" % [anchor[0], anchor[1]]
 
     calendar_status_label.text = status_text
 
-func update_time_wheel_inspector():
-    for child in wheel_events_list.get_children():
-        wheel_events_list.remove_child(child)
-        child.queue_free()
-    for child in future_events_list.get_children():
-        future_events_list.remove_child(child)
-        child.queue_free()
-
-    var stats_label = Label.new()
+func update_time_wheel_inspector(upcoming_events: Array):
+    # 复用上次刷新创建的Label，只更新文本，多余的隐藏
+    var stats_label = _get_reusable_label(wheel_events_list, 0)
+    stats_label.autowrap_mode = TextServer.AUTOWRAP_OFF
     stats_label.text = "总事件: %d | 有事件: %s | 当前槽空: %s" % [
         test_world.event_count,
         "是" if test_world.has_any_events else "否",
         "是" if test_world.is_current_slot_empty else "否"
     ]
-    wheel_events_list.add_child(stats_label)
+    var used_labels = 1
 
-    var upcoming_events = test_world.get_upcoming_events(15, 180 * 24)
     if upcoming_events.size() > 0:
         for event_tuple in upcoming_events:
             var key = event_tuple[0]
             var value = event_tuple[1]
             var delay_hours = event_tuple[2]
-            var event_label = Label.new()
+            var event_label = _get_reusable_label(wheel_events_list, used_labels)
             event_label.text = "🎯 %s (+%dh)" % [str(value).split(" [")[0], delay_hours]
             event_label.autowrap_mode = TextServer.AUTOWRAP_WORD_SMART
-            wheel_events_list.add_child(event_label)
+            used_labels += 1
     else:
-        var no_events_label = Label.new()
+        var no_events_label = _get_reusable_label(wheel_events_list, used_labels)
         no_events_label.text = "暂无即将到来的事件"
-        wheel_events_list.add_child(no_events_label)
+        no_events_label.autowrap_mode = TextServer.AUTOWRAP_OFF
+        used_labels += 1
+    _hide_labels_from(wheel_events_list, used_labels)
 
-    var future_info_label = Label.new()
+    var future_info_label = _get_reusable_label(future_events_list, 0)
     future_info_label.text = "系统状态: %s" % test_world.get_status_summary()
-    future_events_list.add_child(future_info_label)
+    _hide_labels_from(future_events_list, 1)
+
+# 返回容器中第index个Label并设为可见，数量不够时新建一个
+func _get_reusable_label(container: Container, index: int) -> Label:
+    if index < container.get_child_count():
+        var label: Label = container.get_child(index)
+        label.visible = true
+        return label
+    var new_label = Label.new()
+    container.add_child(new_label)
+    return new_label
+
+# 隐藏容器中从index开始的其余Label
+func _hide_labels_from(container: Container, index: int) -> void:
+    for i in range(index, container.get_child_count()):
+        container.get_child(i).visible = false
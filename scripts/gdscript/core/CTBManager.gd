@@ -15,6 +15,9 @@ var _remove_callback: Callable
 var _peek_callback: Callable
 var _pop_callback: Callable
 var _is_slot_empty_callback: Callable
+# 可选：查询距下一个事件的小时数(-1表示没有事件)、一次推进多个小时；都提供时直接跳到下一个事件
+var _next_event_delay_callback: Callable
+var _advance_time_by_callback: Callable
 
 # 状态
 var is_initialized: bool
@@ -23,6 +26,8 @@ var is_initialized: bool
 var on_event_executed: Callable
 
 ## 初始化CTB管理器
+## next_event_delay_callback和advance_time_by_callback可选，同时提供时process_next_turn一次跳到下一个事件，
+## 否则逐小时调用advance_time_callback
 func _init(
     get_time_callback: Callable,
     advance_time_callback: Callable,
@@ -30,7 +35,9 @@ func _init(
     remove_callback: Callable,
     peek_callback: Callable,
     pop_callback: Callable,
-    is_slot_empty_callback: Callable
+    is_slot_empty_callback: Callable,
+    next_event_delay_callback: Callable = Callable(),
+    advance_time_by_callback: Callable = Callable()
 ):
     _get_time_callback = get_time_callback
     _advance_time_callback = advance_time_callback
@@ -39,6 +46,8 @@ func _init(
     _peek_callback = peek_callback
     _pop_callback = pop_callback
     _is_slot_empty_callback = is_slot_empty_callback
+    _next_event_delay_callback = next_event_delay_callback
+    _advance_time_by_callback = advance_time_by_callback
 
     is_initialized = false
 
@@ -51,30 +60,42 @@ func remove_event(schedulable_id: String) -> bool:
 ## 标记CTB系统为已初始化
 func initialize_ctb() -> void:
     is_initialized = true
-    print("CTB系统初始化完成")
+    if ConfigManager.debug_enable_logging:
+        print("CTB系统初始化完成")
 
 ## 处理下一个逻辑回合
 ## 会推进时间直到找到下一个事件。
 ## 这是CTB系统的核心"回合"处理。
 func process_next_turn() -> Dictionary:
     var ticks_advanced = 0
-    while _is_slot_empty_callback.call():
-        if ticks_advanced > 24 * 365:
-            push_error("CTBManager advanced time for over a year without finding any event.")
+    if _next_event_delay_callback.is_valid() and _advance_time_by_callback.is_valid():
+        # 直接查询下一个事件还有多少小时，一次推进到位
+        ticks_advanced = _next_event_delay_callback.call()
+        if ticks_advanced == -1:
+            push_error("CTBManager found no scheduled event to advance to.")
             return {}
-        _advance_time_callback.call()
-        ticks_advanced += 1
+        if ticks_advanced > 0:
+            _advance_time_by_callback.call(ticks_advanced)
+    else:
+        while _is_slot_empty_callback.call():
+            if ticks_advanced > 24 * 365:
+                push_error("CTBManager advanced time for over a year without finding any event.")
+                return {}
+            _advance_time_callback.call()
+            ticks_advanced += 1
 
     var due_event = get_due_event()
     if due_event != null:
-        _execute_event(due_event)
+        # 执行事件不会推进时间，读取一次当前时间供重新调度和返回结果共用
+        var current_time = _get_time_callback.call()
+        _execute_event(due_event, current_time)
         return {
             "type": "SCHEDULABLE_EXECUTED",
             "ticks_advanced": ticks_advanced,
             "schedulable_id": due_event.id,
             "schedulable_name": due_event.name,
             "schedulable_type": due_event.get_type_identifier(),
-            "timestamp": _get_time_callback.call()
+            "timestamp": current_time
         }
 
     push_error("Inconsistent State: Slot was not empty, but no schedulable could be popped.")
@@ -103,7 +124,8 @@ func get_due_event() -> Schedulable:
 
 ## 执行单个可调度对象，包括更新内部逻辑、记录下次调度等
 # 私有方法：执行单个可调度对象
-func _execute_event(schedulable: Schedulable) -> void:
+# current_time 由调用方传入已读取的当前时间，为-1时自行获取
+func _execute_event(schedulable: Schedulable, current_time: int = -1) -> void:
     var result = schedulable.execute()
 
     if on_event_executed.is_valid():
@@ -111,7 +133,8 @@ func _execute_event(schedulable: Schedulable) -> void:
 
     # 如果需要重复调度，计算并调度下一次
     if schedulable.should_reschedule():
-        var current_time = _get_time_callback.call()
+        if current_time < 0:
+            current_time = _get_time_callback.call()
         var next_time = schedulable.calculate_next_schedule_time(current_time)
         schedulable.trigger_time = next_time
         var delay = next_time - current_time
@@ -131,33 +154,37 @@ func get_status_text() -> String:
     ]
 
     # 获取下一个对象
-    var next_events = _peek_callback.call(1, 1)
-    if next_events.size() > 0:
-        var next_event_data = next_events[0]
-        var next_obj = next_event_data["value"]
-        var delay = next_obj.trigger_time - current_time
+    var next_info = _peek_next_event(current_time)
+    if next_info.is_empty():
+        status_lines.append("  下个调度: (无)")
+    else:
+        var next_obj = next_info[0]
+        var delay = next_info[1]
         if delay <= 0:
             status_lines.append("  下个调度: 待执行 (%s)" % next_obj.name)
         else:
             status_lines.append("  下个调度: %d 小时后 (%s)" % [delay, next_obj.name])
-    else:
-        status_lines.append("  下个调度: (无)")
 
     return "\n".join(status_lines)
 
 
 ## 获取下一个调度的时间信息
 func get_next_schedule_time_info() -> String:
-    var next_events = _peek_callback.call(1, 1)
-    if next_events.is_empty():
+    var next_info = _peek_next_event(_get_time_callback.call())
+    if next_info.is_empty():
         return "无"
 
-    var current_time = _get_time_callback.call()
-    var next_event_data = next_events[0]
-    var next_obj = next_event_data["value"]
-    var delay = next_obj.trigger_time - current_time
-
+    var delay = next_info[1]
     if delay <= 0:
         return "待执行"
     else:
         return "%d小时后" % delay
+
+# 私有方法：查看下一个可调度对象及其距current_time的小时数
+# 返回[schedulable, delay]，没有事件时返回空数组；两个状态方法共用这一次查询和计算
+func _peek_next_event(current_time: int) -> Array:
+    var next_events = _peek_callback.call(1, 1)
+    if next_events.is_empty():
+        return []
+    var next_obj = next_events[0]["value"]
+    return [next_obj, next_obj.trigger_time - current_time]
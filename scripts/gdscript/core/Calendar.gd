@@ -27,11 +27,17 @@ enum TimeUnit {
 
 ## 每天小时数（从配置读取）
 var hours_per_day: int:
-    get: return ConfigManager.time_hours_per_day
+    get: return _hours_per_day
 
 ## 每年天数（从配置读取）
 var days_per_year: int:
-    get: return ConfigManager.time_days_per_year
+    get: return _days_per_year
+
+# 配置值快照：每次分解日期都经过ConfigManager按属性名查找开销较大，
+# 构造时读取一次，配置变更时由_on_config_changed()刷新
+var _hours_per_day: int
+var _days_per_year: int
+var _hours_per_year: int  # _hours_per_day * _days_per_year，随配置一起刷新
 
 ## 起始年份
 var _base_year: int
@@ -42,6 +48,27 @@ var _timestamp_hour: int = 0
 ## 当前锚定：[纪元名, 元年公元年份]
 var _current_anchor: Array
 
+# 状态版本号：推进时间、改元/锚定、重置和配置变更时递增，各缓存记录自己对应的版本，不一致即重新计算
+var _version: int = 0
+
+# 日期分解缓存：同一版本下的年、月、日、时只计算一次，由_refresh_date_cache()按需更新
+var _cache_version: int = -1
+var _cache_year: int
+var _cache_day_in_year: int
+var _cache_month: int
+var _cache_day_in_month: int
+var _cache_hour_in_day: int
+var _cache_era_year: int  # 当前年份在锚定纪元中的年数，未到元年时为0
+
+# 格式化文本缓存：界面每次刷新都会重新格式化日期，版本不变时直接返回上次的字符串
+# 键为"gregorian"/"era"/"status"等，版本变化时整体失效
+var _text_cache: Dictionary = {}
+var _text_cache_version: int = -1
+
+# 公历年份前缀（"公元X年"/"公元前X年"）只在跨年时变化，单独缓存最近一次的结果
+var _year_str_year: int
+var _year_str: String = ""
+
 ## 构造函数
 func _init(base_year: int = 0):
     # 如果传入0或没有传入参数，使用配置中的默认值
@@ -50,12 +77,117 @@ func _init(base_year: int = 0):
     else:
         _base_year = base_year
     _current_anchor = ["uninitialized", _base_year]
+    _load_config_values()
+    ConfigManager.config_changed.connect(_on_config_changed)
+
+# 读取时间相关的配置值
+func _load_config_values() -> void:
+    _apply_time_config(ConfigManager.time_hours_per_day, ConfigManager.time_days_per_year)
+
+# 写入时间配置快照并让日期缓存按新参数重新计算
+# 测试可直接调用以注入配置值，而不修改全局配置
+func _apply_time_config(p_hours_per_day: int, p_days_per_year: int) -> void:
+    _hours_per_day = p_hours_per_day
+    _days_per_year = p_days_per_year
+    _hours_per_year = _hours_per_day * _days_per_year
+    _version += 1
+
+# 配置变更后刷新快照
+func _on_config_changed() -> void:
+    _load_config_values()
+
+# 返回当前版本下缓存的格式化文本，未缓存时返回空字符串
+func _get_cached_text(key: String) -> String:
+    if _text_cache_version != _version:
+        _text_cache.clear()
+        _text_cache_version = _version
+        return ""
+    return _text_cache.get(key, "")
 
 ## 当前年份（公元年）
 var current_gregorian_year: int:
     get:
-        var total_days = _timestamp_hour / hours_per_day
-        return _base_year + (total_days / days_per_year)
+        _refresh_date_cache()
+        return _cache_year
+
+## 当前月份
+var current_month: int:
+    get:
+        _refresh_date_cache()
+        return _cache_month
+
+## 当前日期（月内第几天）
+var current_day_in_month: int:
+    get:
+        _refresh_date_cache()
+        return _cache_day_in_month
+
+## 年内第几天
+var current_day_in_year: int:
+    get:
+        _refresh_date_cache()
+        return _cache_day_in_year
+
+## 当天的小时
+var current_hour_in_day: int:
+    get:
+        _refresh_date_cache()
+        return _cache_hour_in_day
+
+## 当前纪元名，当前年份早于锚定元年时为空字符串
+var current_era_name: String:
+    get:
+        return _current_anchor[0] if _current_era_year() > 0 else ""
+
+## 当前纪年（纪元第几年），当前年份早于锚定元年时为0
+var current_era_year: int:
+    get:
+        return _current_era_year()
+
+## 当前锚定：[纪元名, 元年公元年份]
+var current_anchor: Array:
+    get:
+        return _current_anchor
+
+# 返回当前年份在锚定纪元中的年数，未到元年时返回0
+func _current_era_year() -> int:
+    _refresh_date_cache()
+    return _cache_era_year
+
+# 年内第几天(从0开始)到月、日的查表，所有Calendar实例共用，每年天数变化时重建
+static var _day_to_month: PackedInt32Array
+static var _day_to_day_in_month: PackedInt32Array
+
+# 按每年天数建立月、日查找表，每月固定30天
+static func _build_month_tables(year_days: int) -> void:
+    _day_to_month.resize(year_days)
+    _day_to_day_in_month.resize(year_days)
+    for day in range(year_days):
+        _day_to_month[day] = (day / 30) + 1
+        _day_to_day_in_month[day] = (day % 30) + 1
+
+# 时间戳变化后重新分解日期，一次计算供所有属性和格式化方法共用
+func _refresh_date_cache() -> void:
+    if _cache_version == _version:
+        return
+    var day_hours = _hours_per_day
+    if _day_to_month.size() != _days_per_year:
+        _build_month_tables(_days_per_year)
+    # 先按每年小时数直接得到年份，余下的年内小时数再拆成天和小时
+    var years = _timestamp_hour / _hours_per_year
+    var hour_in_year = _timestamp_hour - years * _hours_per_year
+    var day_index = hour_in_year / day_hours
+    _cache_year = _base_year + years
+    _cache_day_in_year = day_index + 1
+    _cache_hour_in_day = hour_in_year - day_index * day_hours
+    _cache_month = _day_to_month[day_index]
+    _cache_day_in_month = _day_to_day_in_month[day_index]
+    # 纪元只在年份或锚定变化时才会变，随日期一起解析一次
+    if _current_anchor.size() >= 2 and _cache_year >= _current_anchor[1]:
+        _cache_era_year = _cache_year - _current_anchor[1] + 1
+    else:
+        _cache_era_year = 0
+    _cache_version = _version
 
 ## 锚定纪元
 ##
@@ -83,6 +215,7 @@ func anchor_era(era_name: String, gregorian_year: int) -> void:
     
     # 存储为 [纪元名, 元年公元年份]
     _current_anchor = [era_name, gregorian_year]
+    _version += 1
 
 ## 改元 - 开始新纪元
 ##
@@ -111,36 +244,52 @@ func start_new_era(name: String) -> void:
 func get_timestamp() -> int:
     return _timestamp_hour
 
+## 获取状态版本号
+##
+## 时间推进、纪元锚定或改元、重置以及配置变更后都会改变。
+## 调用方记录上次看到的版本，版本未变时可以跳过依赖日历状态的重新计算或刷新。
+##
+## 返回:
+##     int: 当前版本号
+func get_version() -> int:
+    return _version
+
 ## 推进时间一个tick（1小时）
 func advance_time_tick() -> void:
     _timestamp_hour += 1
+    _version += 1
+
+## 一次推进多个tick
+##
+## 参数:
+##     ticks: 推进的小时数，必须非负
+func advance_time_ticks(ticks: int) -> void:
+    if ticks < 0:
+        push_error("ticks must be non-negative")
+        return
+    if ticks == 0:
+        return
+    _timestamp_hour += ticks
+    _version += 1
 
 ## 获取当前时间信息
 func get_time_info() -> Dictionary:
-    var total_days = _timestamp_hour / hours_per_day
-    var day_in_year = (total_days % days_per_year) + 1
-    var hour_in_day = _timestamp_hour % hours_per_day
-    var month = ((day_in_year - 1) / 30) + 1
-    var day_in_month = ((day_in_year - 1) % 30) + 1
+    _refresh_date_cache()
     
     # 获取纪元信息
     var era_name = null
     var era_year = null
-    if _current_anchor.size() >= 2:
-        var anchor_era_name = _current_anchor[0]
-        var gregorian_year = _current_anchor[1]
-        var current_year = current_gregorian_year
-        if current_year >= gregorian_year:
-            era_name = anchor_era_name
-            era_year = current_year - gregorian_year + 1
+    if _cache_era_year > 0:
+        era_name = _current_anchor[0]
+        era_year = _cache_era_year
     
     var info = {
         "timestamp": _timestamp_hour,
-        "gregorian_year": current_gregorian_year,
-        "month": month,
-        "day_in_month": day_in_month,
-        "day_in_year": day_in_year,
-        "hour_in_day": hour_in_day,
+        "gregorian_year": _cache_year,
+        "month": _cache_month,
+        "day_in_month": _cache_day_in_month,
+        "day_in_year": _cache_day_in_year,
+        "hour_in_day": _cache_hour_in_day,
         "current_era_name": era_name,
         "current_era_year": era_year,
         "current_anchor": _current_anchor
@@ -151,6 +300,7 @@ func get_time_info() -> Dictionary:
 ## 重置时间到起始状态
 func reset() -> void:
     _timestamp_hour = 0
+    _version += 1
     _current_anchor = ["uninitialized", _base_year]
 
 ## 格式化为公历日期显示
@@ -161,24 +311,36 @@ func reset() -> void:
 ## 返回:
 ##     格式化的日期字符串
 func format_date_gregorian(show_hour: bool = false) -> String:
-    var year = current_gregorian_year
-    var total_days = _timestamp_hour / hours_per_day
-    var day_in_year = (total_days % days_per_year) + 1
-    var month = ((day_in_year - 1) / 30) + 1
-    var day = ((day_in_year - 1) % 30) + 1
-    var hour = _timestamp_hour % hours_per_day
+    var cache_key = "gregorian_hour" if show_hour else "gregorian"
+    var cached = _get_cached_text(cache_key)
+    if not cached.is_empty():
+        return cached
+    _refresh_date_cache()
+    var year = _cache_year
+    var month = _cache_month
+    var day = _cache_day_in_month
+    var hour = _cache_hour_in_day
     
-    # 处理公元前年份
-    var year_str: String
-    if year < 0:
-        year_str = "公元前%d年" % abs(year)
-    else:
-        year_str = "公元%d年" % year
+    var year_str = _get_year_str(year)
     
+    var text: String
     if show_hour:
-        return "%s%d月%d日%d点" % [year_str, month, day, hour]
+        text = "%s%d月%d日%d点" % [year_str, month, day, hour]
     else:
-        return "%s%d月%d日" % [year_str, month, day]
+        text = "%s%d月%d日" % [year_str, month, day]
+    _text_cache[cache_key] = text
+    return text
+
+# 返回公历年份前缀，年份不变时复用上次的字符串
+func _get_year_str(year: int) -> String:
+    if _year_str.is_empty() or _year_str_year != year:
+        # 处理公元前年份
+        if year < 0:
+            _year_str = "公元前%d年" % abs(year)
+        else:
+            _year_str = "公元%d年" % year
+        _year_str_year = year
+    return _year_str
 
 ## 格式化为纪年日期显示
 ##
@@ -188,49 +350,52 @@ func format_date_gregorian(show_hour: bool = false) -> String:
 ## 返回:
 ##     格式化的日期字符串
 func format_date_era(show_hour: bool = false) -> String:
-    # 获取纪元信息
-    var era_name = null
-    var era_year = null
-    if _current_anchor.size() >= 2:
-        var anchor_era_name = _current_anchor[0]
-        var gregorian_year = _current_anchor[1]
-        var current_year = current_gregorian_year
-        if current_year >= gregorian_year:
-            era_name = anchor_era_name
-            era_year = current_year - gregorian_year + 1
-    
-    if era_name == null or era_year == null:
-        return format_date_gregorian(show_hour)
-    
-    var total_days = _timestamp_hour / hours_per_day
-    var day_in_year = (total_days % days_per_year) + 1
-    var month = ((day_in_year - 1) / 30) + 1
-    var day = ((day_in_year - 1) % 30) + 1
-    var hour = _timestamp_hour % hours_per_day
-    
-    if show_hour:
-        return "%s%d年%d月%d日%d点" % [era_name, era_year, month, day, hour]
+    var cache_key = "era_hour" if show_hour else "era"
+    var cached = _get_cached_text(cache_key)
+    if not cached.is_empty():
+        return cached
+    _refresh_date_cache()
+    var era_year = _cache_era_year
+    var text: String
+    if era_year == 0:
+        text = format_date_gregorian(show_hour)
     else:
-        return "%s%d年%d月%d日" % [era_name, era_year, month, day]
+        var era_name = _current_anchor[0]
+        var month = _cache_month
+        var day = _cache_day_in_month
+        var hour = _cache_hour_in_day
+        
+        if show_hour:
+            text = "%s%d年%d月%d日%d点" % [era_name, era_year, month, day, hour]
+        else:
+            text = "%s%d年%d月%d日" % [era_name, era_year, month, day]
+    _text_cache[cache_key] = text
+    return text
 
 ## 获取详细的时间状态文本
 func get_time_status_text() -> String:
-    var info = get_time_info()
+    var cached = _get_cached_text("status")
+    if not cached.is_empty():
+        return cached
+    # 直接读取日期缓存，不构造get_time_info()的字典
+    _refresh_date_cache()
     var gregorian = format_date_gregorian(true)
     var era = format_date_era(true)
     
     var status_lines = [
         "公历: %s" % gregorian,
         "纪年: %s" % era,
-        "年内第%d天" % info["day_in_year"],
-        "总计: %d小时" % info["timestamp"]
+        "年内第%d天" % _cache_day_in_year,
+        "总计: %d小时" % _timestamp_hour
     ]
     
     # 显示锚定信息
-    if info["current_anchor"] != null and info["current_anchor"].size() >= 2:
-        var anchor = info["current_anchor"]
+    if _current_anchor.size() >= 2:
+        var anchor = _current_anchor
         var era_name = anchor[0]
         var gregorian_year = anchor[1]
         status_lines.append("锚定: %s元年 = 公元%d年" % [era_name, gregorian_year])
     
-    return "\n".join(status_lines)
+    var text = "\n".join(status_lines)
+    _text_cache["status"] = text
+    return text
@@ -5,7 +5,7 @@ class_name IndexedTimeWheel
 ##
 ## Core Design:
 ## - Circular Buffer: Uses a fixed-size array for an efficient time window.
-## - Linked List Slots: Each time slot uses a list to store events that trigger at the same time.
+## - Linked List Slots: Each time slot is a doubly linked FIFO list (behind a sentinel head) of events that trigger at the same time.
 ## - Dynamic Offset: An 'offset' pointer points to the current time slot (buffer design).
 ## - Generic Support: Can store any type of event object.
 ##
@@ -19,35 +19,66 @@ class_name IndexedTimeWheel
 class EventNode:
     var key: Variant
     var value: Variant
-    var slot_index: int  # When slot_index == -1, it indicates the event is in the _future_events list
-    var absolute_hour: int
-
-    func _init(p_key: Variant, p_value: Variant, p_slot_index: int, p_absolute_hour: int = -1):
+    var slot_index: int  # When slot_index == -1, it indicates the event is in the future events heap;
+                         # -2 marks a future event that was removed but is still in the heap
+    var prev: EventNode  # Previous node in the same slot (the slot's sentinel for the first event)
+    var next: EventNode  # Next node in the same slot, null for the slot tail
+
+    # 不单独存储absolute_hour：未来事件的小时数编码在_future_keys的排序键中，
+    # 时间轮内的事件可由slot_index与_offset推算，无需重复保存
+    func _init(p_key: Variant, p_value: Variant, p_slot_index: int):
         key = p_key
         value = p_value
         slot_index = p_slot_index
-        absolute_hour = p_absolute_hour
 
     func _to_string() -> String:
         return "EventNode(Key=%s, Value=%s)" % [key, value]
 
+# 节点池上限，避免一次性大量删除后池子无限膨胀
+const _NODE_POOL_LIMIT = 1024
+# 未来事件排序键中seq占低32位
+const _FUTURE_SEQ_LIMIT = 1 << 32
+
 var _buffer_size: int
 var _get_time_callback: Callable
 
-# Core circular buffer - each slot stores a list of events
-var _slots: Array[Array]
+# Core circular buffer - each slot is a linked list of events, stored as parallel head/tail arrays
+# 头尾指针拆成两个平行数组，省去每个槽位一个[head, tail]小数组及一次额外的下标间接访问
+# 每个槽位的头是一个固定的哨兵节点，第一个事件为哨兵的next；空槽位的尾指针指向哨兵本身，
+# 这样插入、弹出和删除都不需要对空链表或头节点做特殊处理
+var _slot_heads: Array[EventNode]
+var _slot_tails: Array[EventNode]
 var _offset: int
 
 # Indexing and future events
 var _index: Dictionary
-var _future_events: Array  # Array of [absolute_hour, EventNode]
-var _lock: Mutex
+var _count: int  # 已调度事件总数，与_index.size()保持一致，读取时无需加锁
+# 未来事件按(absolute_hour, seq)排序的二叉最小堆，seq保证同一小时内先调度的先迁入时间轮
+# 排序键打包成一个整数 (absolute_hour << 32) | seq，与节点分存在两个平行数组中，
+# 堆调整时只需一次整数比较，也不必为每个未来事件分配一个[hour, seq, node]小数组
+# 删除未来事件时只做标记(slot_index = -2)，等它到达堆顶时再丢弃
+var _future_keys: PackedInt64Array  # Binary heap keys: (absolute_hour << 32) | seq
+var _future_nodes: Array[EventNode]  # EventNode at the same heap position as its key
+var _future_seq: int  # 堆清空时归零；达到32位上限时由_rebase_future_seq()重新编号，避免溢出到小时位
+var _future_count: int  # 堆中未被删除的未来事件数
+
+# 非空槽位位图，每个槽位一位，按64位分组存储；槽位变为非空/空时置位/清零
+# 查找下一个非空槽位时按字跳过空槽位，不必逐槽扫描
+var _occupied: PackedInt64Array
+var _lock: Mutex  # null when constructed with thread_safe = false
+
+# 已回收的EventNode，角色每次行动都会重新调度，复用节点以减少分配
+var _node_pool: Array[EventNode]
 
 ## An indexed, generic time wheel data structure with support for future events.
-## internally uses a list for each slot, providing O(1) for add/pop but O(N) for removal by key.
-## Tracks and removes events in O(1) from the index, but removal from the slot list is O(N)
-## where N is the number of events in that slot.
-func _init(buffer_size: int, get_time_callback: Callable):
+## internally uses a doubly linked list for each slot, providing O(1) for add/pop and for removal by key:
+## the index finds the node and the node unlinks itself through its prev/next pointers.
+##
+## Pass thread_safe = false when the wheel is only touched from one thread (e.g. the main game loop);
+## every method then skips the Mutex lock/unlock pair.
+##
+## Slot indices wrap with a compare-and-subtract, so buffer_size does not need to be a power of two.
+func _init(buffer_size: int, get_time_callback: Callable, thread_safe: bool = true):
     if buffer_size <= 0:
         push_error("Time wheel size must be positive.")
         return
@@ -56,180 +87,445 @@ func _init(buffer_size: int, get_time_callback: Callable):
     _get_time_callback = get_time_callback
 
     # Initialize slots
-    _slots = []
-    _slots.resize(_buffer_size)
+    _slot_heads = []
+    _slot_heads.resize(_buffer_size)
+    _slot_tails = []
+    _slot_tails.resize(_buffer_size)
     for i in range(_buffer_size):
-        _slots[i] = []
+        var sentinel := EventNode.new(null, null, i)
+        _slot_heads[i] = sentinel
+        _slot_tails[i] = sentinel
     _offset = 0
 
     _index = {}
-    _future_events = []
-    _lock = Mutex.new()
-
-## 私有的调度内核的正确方法
-## 需要在已获得锁且保证条件正确后，对应调用此方法来执行实际的调度逻辑
+    _count = 0
+    _future_keys = PackedInt64Array()
+    _future_nodes = []
+    _future_seq = 0
+    _future_count = 0
+    _occupied = PackedInt64Array()
+    _occupied.resize((_buffer_size + 63) >> 6)
+    _lock = Mutex.new() if thread_safe else null
+    _node_pool = []
+
+# prev/next互相引用会形成RefCounted循环引用，时间轮释放前需要手动断开各槽位的链表
+func _notification(what: int) -> void:
+    if what == NOTIFICATION_PREDELETE:
+        for sentinel in _slot_heads:
+            var node: EventNode = sentinel.next
+            sentinel.next = null
+            while node != null:
+                var next_node: EventNode = node.next
+                node.prev = null
+                node.next = null
+                node = next_node
+
+## Takes a node from the pool, or creates a new one if the pool is empty.
+func _acquire_node(key: Variant, value: Variant, slot_index: int) -> EventNode:
+    if _node_pool.is_empty():
+        return EventNode.new(key, value, slot_index)
+    var node: EventNode = _node_pool.pop_back()
+    node.key = key
+    node.value = value
+    node.slot_index = slot_index
+    return node
+
+## Clears a detached node and returns it to the pool.
+func _release_node(node: EventNode) -> void:
+    # 清空引用，避免池中节点延长事件对象的生命周期
+    node.key = null
+    node.value = null
+    node.prev = null
+    node.next = null
+    if _node_pool.size() < _NODE_POOL_LIMIT:
+        _node_pool.append(node)
+
+## 私有的调度内核，两个公开的调度方法都只做参数换算后调用此方法
+## 需要在已获得锁后调用；负责全部校验，校验失败时报错并不做任何修改
 func _schedule_internal(key: Variant, value: Variant, delay: int, now: int) -> void:
     # 此方法假设:
-    # 1. 已经持有 lock 锁内。
-    # 2. key 的唯一性和 delay 的非负性已经由调用方保证。
-    # 3. now 是当前刚刚获取的当前时间。
-
-    var absolute_hour = now + delay
+    # 1. 已经持有 lock 锁内（或时间轮为非线程安全模式）。
+    # 2. now 是当前刚刚获取的当前时间。
+    if delay < 0:
+        push_error("Cannot schedule in the past.")
+        return
+    if _index.has(key):
+        push_error("Key '%s' already exists." % key)
+        return
 
+    var node: EventNode
     if delay >= _buffer_size:
         # 存储到未来事件
-        var node = EventNode.new(key, value, -1, absolute_hour)
-        _insert_future_event(absolute_hour, node)
-        _index[key] = node
+        node = _acquire_node(key, value, -1)
+        _insert_future_event(now + delay, node)
     else:
         # 存储到时间轮
-        var target_index = (_offset + delay) % _buffer_size
-        var node = EventNode.new(key, value, target_index, absolute_hour)
-        _insert_to_wheel(node, target_index)
-        _index[key] = node
+        # 调度是最热的路径，这里内联_insert_to_wheel，省去一次函数调用
+        # delay < _buffer_size，相加后最多超出一圈，减一次即可代替取模
+        var target_index = _offset + delay
+        if target_index >= _buffer_size:
+            target_index -= _buffer_size
+        node = _acquire_node(key, value, target_index)
+        var tail: EventNode = _slot_tails[target_index]
+        if tail == _slot_heads[target_index]:
+            _occupied[target_index >> 6] |= 1 << (target_index & 63)
+        node.prev = tail
+        tail.next = node
+        _slot_tails[target_index] = node
+
+    _index[key] = node
+    _count += 1
 
 ## 根据延迟后调度事件，这是一个线程安全的包装方法
 func schedule_with_delay(key: Variant, value: Variant, delay: int) -> void:
-    _lock.lock()
-
-    if _index.has(key):
-        _lock.unlock()
-        push_error("Key '%s' already exists." % key)
-        return
-    if delay < 0:
-        _lock.unlock()
-        push_error("Delay must be non-negative.")
-        return
-
-    var now = _get_time_callback.call()
-    _schedule_internal(key, value, delay, now)
-
-    _lock.unlock()
+    if _lock: _lock.lock()
+    _schedule_internal(key, value, delay, _get_time_callback.call())
+    if _lock: _lock.unlock()
     # TODO: Notify UI to re-render after data changes.
 
 ## 在指定的绝对时间点安排事件，修复了原有的静态方法命名错误。
 func schedule_at_absolute_hour(key: Variant, value: Variant, absolute_hour: int) -> void:
-    _lock.lock()
-
+    if _lock: _lock.lock()
     var now = _get_time_callback.call()
-    if absolute_hour < now:
-        _lock.unlock()
-        push_error("Cannot schedule in the past.")
-        return
-    if _index.has(key):
-        _lock.unlock()
-        push_error("Key '%s' already exists." % key)
-        return
-
-    var delay = absolute_hour - now
-    _schedule_internal(key, value, delay, now)
-
-    _lock.unlock()
+    _schedule_internal(key, value, absolute_hour - now, now)
+    if _lock: _lock.unlock()
     # TODO: Notify UI to re-render after data changes.
 
-## Inserts an event node into the specified target index slot.
+## Inserts an event node at the tail of the specified target index slot.
 func _insert_to_wheel(event_node: EventNode, target_index: int) -> void:
-    _slots[target_index].append(event_node)
-
-## Inserts a future event into the list, finding the correct sorted position by iterating backwards.
+    var tail: EventNode = _slot_tails[target_index]
+    if tail == _slot_heads[target_index]:
+        _occupied[target_index >> 6] |= 1 << (target_index & 63)
+    event_node.prev = tail
+    tail.next = event_node
+    _slot_tails[target_index] = event_node
+
+## Inserts a future event into the heap in O(log n).
 func _insert_future_event(absolute_hour: int, node: EventNode) -> void:
-    # Find insertion point from the end of the list.
-    var insert_index = 0
-    for i in range(_future_events.size() - 1, -1, -1):
-        if _future_events[i][0] <= absolute_hour:
-            insert_index = i + 1
+    if _future_seq >= _FUTURE_SEQ_LIMIT:
+        _rebase_future_seq()
+    var key: int = (absolute_hour << 32) | _future_seq
+    _future_seq += 1
+    _future_count += 1
+
+    _future_keys.append(key)
+    _future_nodes.append(node)
+    var i = _future_keys.size() - 1
+    while i > 0:
+        var parent = (i - 1) >> 1
+        var parent_key: int = _future_keys[parent]
+        if parent_key < key:
             break
-
-    # Insert at the correct position to maintain sort order.
-    _future_events.insert(insert_index, [absolute_hour, node])
+        _future_keys[i] = parent_key
+        _future_nodes[i] = _future_nodes[parent]
+        i = parent
+    _future_keys[i] = key
+    _future_nodes[i] = node
+
+## Renumbers the sequence part of every heap key from 0, keeping the existing order.
+## Removed entries keep the heap from ever draining, so _future_seq alone would eventually
+## overflow into the hour bits; this runs once every 2^32 insertions.
+func _rebase_future_seq() -> void:
+    var order: Array = range(_future_keys.size())
+    order.sort_custom(func(a, b): return _future_keys[a] < _future_keys[b])
+
+    # 按键升序排列的数组本身就是合法的最小堆；顺便丢弃已删除的条目
+    var keys := PackedInt64Array()
+    var nodes: Array[EventNode] = []
+    for i in order:
+        var node: EventNode = _future_nodes[i]
+        if node.slot_index == -2:
+            _release_node(node)
+            continue
+        keys.append(((_future_keys[i] >> 32) << 32) | keys.size())
+        nodes.append(node)
+    _future_keys = keys
+    _future_nodes = nodes
+    _future_seq = keys.size()
+
+## Pops the EventNode with the smallest key from the future events heap.
+## Read its absolute hour with _future_top_hour() before popping.
+func _pop_future_event() -> EventNode:
+    var top: EventNode = _future_nodes[0]
+    var size = _future_keys.size() - 1
+    var last_key: int = _future_keys[size]
+    var last_node: EventNode = _future_nodes.pop_back()
+    _future_keys.resize(size)
+    if size == 0:
+        _future_seq = 0
+        return top
+
+    var i = 0
+    while true:
+        var child = 2 * i + 1
+        if child >= size:
+            break
+        var child_key: int = _future_keys[child]
+        if child + 1 < size and _future_keys[child + 1] < child_key:
+            child += 1
+            child_key = _future_keys[child]
+        if last_key < child_key:
+            break
+        _future_keys[i] = child_key
+        _future_nodes[i] = _future_nodes[child]
+        i = child
+    _future_keys[i] = last_key
+    _future_nodes[i] = last_node
+    return top
+
+## Returns the absolute hour of the earliest future event. The heap must not be empty.
+func _future_top_hour() -> int:
+    return _future_keys[0] >> 32
+
+## Discards removed entries from the top of the future events heap, recycling their nodes.
+func _drop_removed_future_events() -> void:
+    while not _future_nodes.is_empty() and _future_nodes[0].slot_index == -2:
+        _release_node(_pop_future_event())
 
 ## Checks if the current time slot is empty.
+## Used by external callers; methods inside the wheel read the sentinel directly.
 func _is_current_slot_empty() -> bool:
-    return _slots[_offset].size() == 0
+    return _slot_heads[_offset].next == null
+
+## Detaches the first node of the current time slot and removes it from the index.
+## Returns null if the current slot is empty. Must be called with the lock held;
+## the caller reads the node's key/value and then hands it back with _release_node().
+func _pop_head_node() -> EventNode:
+    # 内联空槽判断：直接读取哨兵的next
+    var sentinel: EventNode = _slot_heads[_offset]
+    var node_to_pop: EventNode = sentinel.next
+    if node_to_pop == null:
+        return null
+
+    # 从链表头部取出节点，O(1)，不需要像Array.pop_front()那样移动其余元素
+    var next_node: EventNode = node_to_pop.next
+    sentinel.next = next_node
+    if next_node == null:
+        _slot_tails[_offset] = sentinel
+        _occupied[_offset >> 6] &= ~(1 << (_offset & 63))
+    else:
+        next_node.prev = sentinel
+
+    _index.erase(node_to_pop.key)
+    _count -= 1
+    return node_to_pop
 
 ## Pops a due event from the head of the current time slot.
-## Returns a Dictionary with 'key' and 'value', or null if the current slot is empty.
+## Returns a Dictionary with 'key' and 'value', or an empty Dictionary if the current slot is empty.
 func pop_due_event() -> Dictionary:
-    _lock.lock()
-
-    if _is_current_slot_empty():
-        _lock.unlock()
+    if _lock: _lock.lock()
+    var node := _pop_head_node()
+    if node == null:
+        if _lock: _lock.unlock()
         return {}
 
-    var node_to_pop: EventNode = _slots[_offset][0]
-    _slots[_offset].pop_front()
+    var result = {"key": node.key, "value": node.value}
+    _release_node(node)
+    if _lock: _lock.unlock()
+    # TODO: Notify UI to re-render after data changes.
+    return result
 
-    _index.erase(node_to_pop.key)
+## Pops a due event from the head of the current time slot and returns only its value.
+## Returns null if the current slot is empty. For callers that do not need the key,
+## this skips allocating the result Dictionary that pop_due_event() returns.
+func pop_due_value() -> Variant:
+    if _lock: _lock.lock()
+    var node := _pop_head_node()
+    if node == null:
+        if _lock: _lock.unlock()
+        return null
 
-    _lock.unlock()
-    # TODO: Notify UI to re-render after data changes.
-    return {"key": node_to_pop.key, "value": node_to_pop.value}
+    var value = node.value
+    _release_node(node)
+    if _lock: _lock.unlock()
+    return value
 
 ## Advances the time wheel state: updates the offset and moves upcoming future events into the main wheel.
 func advance_wheel() -> void:
-    _lock.lock()
+    if _lock: _lock.lock()
 
-    if not _is_current_slot_empty():
-        _lock.unlock()
+    if _slot_heads[_offset].next != null:
+        if _lock: _lock.unlock()
         push_error("Cannot advance wheel: current slot is not empty.")
         return
 
     # Advance the offset by one position
-    _offset = (_offset + 1) % _buffer_size
-
-    # Check if any future events need to be moved to the main wheel
-    # Since the list is sorted by absolute_hour, we only need to check the first element
-    # Only move events when they are within the range of current_time + buffer_size - 1
-    var time_threshold = _get_time_callback.call() + _buffer_size - 1
-    while _future_events.size() > 0 and _future_events[0][0] <= time_threshold:
-        var future_event = _future_events.pop_front()
-        var absolute_hour = future_event[0]
-        var node: EventNode = future_event[1]
-
-        assert(absolute_hour == time_threshold, "This event should have been handled earlier.")
-
-        # Insert the due future event into the farthest slot of the time wheel (offset - 1)
-        # This way, the event will be triggered at the correct time as the wheel turns
-        var target_index = (_offset - 1 + _buffer_size) % _buffer_size
+    _offset += 1
+    if _offset == _buffer_size:
+        _offset = 0
+
+    # 推进时间轮期间日历时间不会变化，只读取一次
+    var now = _get_time_callback.call()
+    _migrate_future_events(now)
+
+    assert(_future_keys.is_empty() or _future_top_hour() > now,
+           "Future events are not correctly ordered.")
+
+    if _lock: _lock.unlock()
+
+## Advances the time wheel by several hours at once, equivalent to calling advance_wheel() 'steps' times.
+## Like advance_wheel(), it expects the calendar to have been advanced already.
+## No event may fall inside the skipped hours (see ticks_until_next_event()); otherwise nothing changes.
+func advance_wheel_by(steps: int) -> void:
+    if steps < 0:
+        push_error("Steps must be non-negative.")
+        return
+    if steps == 0:
+        return
+
+    if _lock: _lock.lock()
+
+    var now = _get_time_callback.call()
+    var next_delay = _next_event_delay(now - steps)
+    if next_delay != -1 and next_delay < steps:
+        if _lock: _lock.unlock()
+        push_error("Cannot advance wheel by %d hours: an event is due in %d hours." % [steps, next_delay])
+        return
+
+    # 跳过的槽位都是空的，直接移动offset；steps可能超过一圈，这里仍需取模
+    _offset = (_offset + steps) % _buffer_size
+    _migrate_future_events(now)
+
+    if _lock: _lock.unlock()
+
+## Moves future events that now fall within the wheel window (up to now + buffer_size - 1) into their slots.
+## Must be called with the lock held, after _offset has been moved to match 'now'.
+func _migrate_future_events(now: int) -> void:
+    # Since the heap is ordered by absolute_hour, we only need to check the top element
+    var time_threshold = now + _buffer_size - 1
+    while not _future_keys.is_empty() and _future_top_hour() <= time_threshold:
+        var absolute_hour = _future_top_hour()
+        var node := _pop_future_event()
+        if node.slot_index == -2:
+            # 已删除的未来事件，到期时回收节点
+            _release_node(node)
+            continue
+        _future_count -= 1
+
+        assert(absolute_hour >= now, "This event should have been handled earlier.")
+
+        # 逐小时推进时，迁入的事件总是落在最远的槽位(offset - 1)，随着时间轮转动在正确的时间触发；
+        # 批量推进时可能一次迁入多个小时的事件，按与当前时间的差值计算槽位
+        # absolute_hour - now不超过_buffer_size - 1，最多减一次
+        var target_index = _offset + absolute_hour - now
+        if target_index >= _buffer_size:
+            target_index -= _buffer_size
         node.slot_index = target_index
         _insert_to_wheel(node, target_index)
 
-    assert(_future_events.size() == 0 or _future_events[0][0] > _get_time_callback.call(),
-           "Future events are not correctly ordered.")
+## Returns how many hours remain until the next scheduled event, including future events.
+## Returns 0 if the current slot has due events, or -1 if nothing is scheduled.
+## Scans the occupancy bitmap 64 slots at a time instead of checking the empty slots one by one.
+func ticks_until_next_event() -> int:
+    if _lock: _lock.lock()
+
+    if _slot_heads[_offset].next != null:
+        if _lock: _lock.unlock()
+        return 0
 
-    _lock.unlock()
+    var result = _next_event_delay(_get_time_callback.call())
 
-## Removes an event from the time wheel or the future events list.
+    if _lock: _lock.unlock()
+    return result
+
+## Returns the delay from 'now' to the next event in the wheel or the future heap, or -1 if there is none.
+## Must be called with the lock held, with 'now' being the time the current slot represents.
+func _next_event_delay(now: int) -> int:
+    var result = _next_wheel_event_delay()
+
+    # 未来事件一定比时间轮内的事件晚，只有时间轮为空时才需要看
+    if result == -1:
+        _drop_removed_future_events()
+        if not _future_keys.is_empty():
+            result = _future_top_hour() - now
+    return result
+
+## Returns the delay from the current slot to the nearest non-empty wheel slot, or -1 if the wheel is empty.
+## Must be called with the lock held.
+func _next_wheel_event_delay() -> int:
+    var words: PackedInt64Array = _occupied
+    var word_count = words.size()
+    var word_index = _offset >> 6
+    # 当前字内只看offset及之后的位；右移后仍非零说明这些位里有非空槽位
+    var word: int = words[word_index] >> (_offset & 63)
+    if word != 0:
+        return _trailing_zeros(word)
+
+    # 依次检查后续的字，绕回起始字时其低位对应最远的几个槽位
+    for i in range(1, word_count + 1):
+        word_index = (word_index + 1) % word_count
+        word = words[word_index]
+        if word != 0:
+            # 绕回到offset之前的槽位时差值为负，加一圈得到非负延迟
+            var delay = (word_index << 6) + _trailing_zeros(word) - _offset
+            if delay < 0:
+                delay += _buffer_size
+            return delay
+    return -1
+
+## Returns the index of the lowest set bit of a non-zero word.
+## Binary search on the low bits, so the sign bit needs no special handling.
+static func _trailing_zeros(word: int) -> int:
+    var n = 0
+    if (word & 0xFFFFFFFF) == 0:
+        n += 32
+        word >>= 32
+    if (word & 0xFFFF) == 0:
+        n += 16
+        word >>= 16
+    if (word & 0xFF) == 0:
+        n += 8
+        word >>= 8
+    if (word & 0xF) == 0:
+        n += 4
+        word >>= 4
+    if (word & 0x3) == 0:
+        n += 2
+        word >>= 2
+    if (word & 0x1) == 0:
+        n += 1
+    return n
+
+## Removes an event from the time wheel or the future events heap.
 ## Returns the value of the removed event, or null if the key is not found.
 func remove(key: Variant) -> Variant:
-    _lock.lock()
+    if _lock: _lock.lock()
 
-    if not _index.has(key):
-        _lock.unlock()
+    # 一次查找同时完成存在性判断和取值
+    var node_to_remove: EventNode = _index.get(key)
+    if node_to_remove == null:
+        if _lock: _lock.unlock()
         return null
 
-    var node_to_remove: EventNode = _index[key]
+    var value = node_to_remove.value
+    _index.erase(key)
+    _count -= 1
 
-    # Case 1: Event is in the future pool, remove it directly from the list
+    # Case 1: Event is in the future heap; mark it removed instead of searching the heap.
+    # The node stays in the heap until it reaches the top, and is recycled then.
     if node_to_remove.slot_index == -1:
-        # Remove from the future events list
-        for i in range(_future_events.size() - 1, -1, -1):
-            if _future_events[i][1].key == key:
-                _future_events.remove_at(i)
-                break
-    # Case 2: Event is in the time wheel, remove it from the corresponding slot's list
+        node_to_remove.slot_index = -2
+        node_to_remove.key = null
+        node_to_remove.value = null
+        _future_count -= 1
+    # Case 2: Event is in the time wheel, unlink it from the corresponding slot's list
     else:
-        var slot_events = _slots[node_to_remove.slot_index]
-        for i in range(slot_events.size() - 1, -1, -1):
-            if slot_events[i].key == key:
-                slot_events.remove_at(i)
-                break
-
-    _index.erase(key)
-
-    _lock.unlock()
+        # 双向链表直接摘除，O(1)；前驱至少是哨兵，无需判空
+        var prev_node: EventNode = node_to_remove.prev
+        var next_node: EventNode = node_to_remove.next
+        prev_node.next = next_node
+        if next_node == null:
+            var slot_index = node_to_remove.slot_index
+            _slot_tails[slot_index] = prev_node
+            if prev_node == _slot_heads[slot_index]:
+                _occupied[slot_index >> 6] &= ~(1 << (slot_index & 63))
+        else:
+            next_node.prev = prev_node
+        _release_node(node_to_remove)
+
+    if _lock: _lock.unlock()
     # TODO: Notify UI to re-render after data changes.
-    return node_to_remove.value
+    return value
 
 ## [For UI Rendering Only] Previews upcoming events within the next 'count' hours.
 ## Returns a NEW ARRAY containing references to the original event data with original_trigger_time recorded.
@@ -246,68 +542,84 @@ func peek_upcoming_events(count: int, max_hours: int = -1) -> Array[Dictionary]:
     if count <= 0:
         return []
 
-    _lock.lock()
+    if _lock: _lock.lock()
 
     var events: Array[Dictionary] = []
+    var found = 0
     # 限制搜索范围不超过buffer_size，避免重复访问同一槽位
     var hours_to_search = max_hours if max_hours > 0 else _buffer_size
     hours_to_search = min(hours_to_search, _buffer_size)
+    # 时间轮内尚未遍历到的事件数，归零后剩余槽位必然为空，可提前结束
+    var remaining_in_wheel = _count - _future_count
 
-    # 遍历指定小时数的槽位
-    for i in range(hours_to_search):
-        var index = (_offset + i) % _buffer_size
-        var current_nodes = _slots[index]
+    # 循环内用到的成员先读到局部变量，减少每个节点的成员访问
+    var heads: Array[EventNode] = _slot_heads
+    var offset: int = _offset
+    var size: int = _buffer_size
 
-        for node in current_nodes:
-            if not "trigger_time" in node.value:
+    # 直接从第一个非空槽位开始，跳过前面的空槽位
+    var first_delay = 0
+    if remaining_in_wheel > 0:
+        first_delay = _next_wheel_event_delay()
+
+    # 遍历指定小时数的槽位
+    for i in range(first_delay, hours_to_search):
+        if remaining_in_wheel == 0:
+            break
+        # i < size，下标最多超出一圈
+        var slot = offset + i
+        if slot >= size:
+            slot -= size
+        var node: EventNode = heads[slot].next
+
+        while node != null:
+            var value = node.value
+            if not "trigger_time" in value:
                 push_error("Event object missing trigger_time: %s" % node.key)
-            var trigger_time = node.value.trigger_time
+            var trigger_time = value.trigger_time
             # 创建新的Dictionary，包含原始trigger_time用于UI预览和动画
             events.append({
                 "key": node.key, 
-                "value": node.value, 
+                "value": value, 
                 "trigger_time": trigger_time,
                 "original_trigger_time": trigger_time  # 记录原始时间，用于UI动画和预览取消
             })
-            # 达到指定事件数量就返回
-            if events.size() >= count:
-                var result = events.slice(0, count)  # slice创建新数组副本
-                _lock.unlock()
-                return result
-
-    _lock.unlock()
+            found += 1
+            remaining_in_wheel -= 1
+            # 达到指定事件数量就返回；events本身就是新数组，不需要再slice复制
+            if found >= count:
+                if _lock: _lock.unlock()
+                return events
+            node = node.next
+
+    if _lock: _lock.unlock()
     return events
 
 ## Gets the value of a scheduled event by its key.
 ## Returns the value of the event, or null if not found.
+## Lock-free when the wheel was created with thread_safe = false. In thread-safe mode the lock is kept,
+## because a Godot Dictionary may rehash while another thread inserts into it.
 func get_event(key: Variant) -> Variant:
-    _lock.lock()
+    if _lock: _lock.lock()
 
-    if _index.has(key):
-        var result = _index[key].value
-        _lock.unlock()
-        return result
-
-    _lock.unlock()
-    return null
+    var node: EventNode = _index.get(key)
+    var result = node.value if node != null else null
+    if _lock: _lock.unlock()
+    return result
 
 ## Checks if a key exists in the time wheel.
+## Same locking rules as get_event().
 func contains(key: Variant) -> bool:
-    _lock.lock()
+    if _lock: _lock.lock()
     var result = _index.has(key)
-    _lock.unlock()
+    if _lock: _lock.unlock()
     return result
 
 ## Returns the total number of scheduled events.
+## Reads a single int counter, so no lock is taken.
 func get_count() -> int:
-    _lock.lock()
-    var result = _index.size()
-    _lock.unlock()
-    return result
+    return _count
 
-## Checks if there are any events in the time wheel or in the future events list.
+## Checks if there are any events in the time wheel or in the future events heap.
 func has_any_events() -> bool:
-    _lock.lock()
-    var result = _index.size() > 0
-    _lock.unlock()
-    return result
+    return _count > 0
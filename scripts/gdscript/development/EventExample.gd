@@ -11,31 +11,40 @@ class_name EventExample
 ## - 提供随机行动系统作为测试用途
 ## - 展示时间计算和状态管理的基本模式
 
+## 预定义行动列表（只读），每个实例的action_list从这里复制
+const ACTION_LIST: Array[String] = [
+    "攻击",
+    "防御",
+    "使用技能",
+    "移动",
+    "观察",
+    "休息",
+    "准备反击",
+    "蓄力"
+]
+
 var faction: String
-var action_list: Array[String]
+var action_list: Array[String] = ACTION_LIST.duplicate()  # 每个实例独立可修改的副本
 var reschedule_enabled: bool = true  # 是否允许重复调度
 
+# 行动间隔样本缓冲区（单位：小时），所有实例共享
+# 每次重新填充时才读取一次配置并批量采样，摊薄随机数和ConfigManager查询的开销
+const _DELAY_BATCH_SIZE = 256
+static var _delay_buffer: PackedInt32Array = PackedInt32Array()
+static var _delay_index: int = 0
+static var _delay_config_hooked: bool = false
+
 func _init(p_id: String, p_name: String, p_faction: String = "中立"):
     super._init(p_id, p_name, "%s的战斗行动" % p_name)
     faction = p_faction
-    
-    # 预定义行动列表
-    action_list = [
-        "攻击",
-        "防御", 
-        "使用技能",
-        "移动",
-        "观察",
-        "休息",
-        "准备反击",
-        "蓄力"
-    ]
 
 ## 执行角色行动
 func execute() -> Variant:
     # 随机选择一个行动
-    var random_action = action_list[randi() % action_list.size()]
-    print("角色 %s 执行行动: %s" % [name, random_action])
+    var random_action = action_list.pick_random()
+    # 每次行动都会执行，默认不输出，只在开启事件执行日志时格式化并打印
+    if ConfigManager.debug_log_event_execution:
+        print("角色 %s 执行行动: %s" % [name, random_action])
     
     return {
         "actor": self,
@@ -45,12 +54,10 @@ func execute() -> Variant:
 
 ## 计算下次行动时间
 func calculate_next_schedule_time(current_time: int) -> int:
-    # 使用配置中的三角分布参数
-    var min_days = ConfigManager.ctb_action_delay_min_days
-    var max_days = ConfigManager.ctb_action_delay_max_days
-    var peak_days = ConfigManager.ctb_action_delay_peak_days
-    var days = _triangular_distribution(min_days, max_days, peak_days)
-    var hours = int(days * ConfigManager.time_hours_per_day)
+    if _delay_index >= _delay_buffer.size():
+        _refill_delay_buffer()
+    var hours = _delay_buffer[_delay_index]
+    _delay_index += 1
     return current_time + hours
 
 ## 是否需要重复调度
@@ -58,15 +65,34 @@ func should_reschedule() -> bool:
     return reschedule_enabled  # 可配置的重复调度
 
 
-## 三角分布实现
-func _triangular_distribution(min_val: float, max_val: float, mode: float) -> float:
-    var u = randf()
-    var c = (mode - min_val) / (max_val - min_val)
-    
-    if u < c:
-        return min_val + sqrt(u * (max_val - min_val) * (mode - min_val))
-    else:
-        return max_val - sqrt((1 - u) * (max_val - min_val) * (max_val - mode))
+## 使用配置中的三角分布参数批量生成行动间隔
+static func _refill_delay_buffer() -> void:
+    if not _delay_config_hooked:
+        # 配置变更后丢弃旧样本，下次调用时按新参数重新采样
+        ConfigManager.config_changed.connect(func(): _delay_index = _delay_buffer.size())
+        _delay_config_hooked = true
+
+    var min_days: float = ConfigManager.ctb_action_delay_min_days
+    var max_days: float = ConfigManager.ctb_action_delay_max_days
+    var peak_days: float = ConfigManager.ctb_action_delay_peak_days
+    var hours_per_day: float = ConfigManager.time_hours_per_day
+
+    # 三角分布的逆变换采样，只与参数有关的量在循环外算好
+    var span = max_days - min_days
+    var c = (peak_days - min_days) / span
+    var low_scale = span * (peak_days - min_days)
+    var high_scale = span * (max_days - peak_days)
+
+    _delay_buffer.resize(_DELAY_BATCH_SIZE)
+    for i in range(_DELAY_BATCH_SIZE):
+        var u = randf()
+        var days: float
+        if u < c:
+            days = min_days + sqrt(u * low_scale)
+        else:
+            days = max_days - sqrt((1 - u) * high_scale)
+        _delay_buffer[i] = int(days * hours_per_day)
+    _delay_index = 0
 
 ## 获取角色信息
 func get_character_info() -> Dictionary:
@@ -77,6 +103,3 @@ func get_character_info() -> Dictionary:
         "trigger_time": trigger_time,
         "description": description
     }
-
-func get_type_identifier() -> String:
-    return "EventExample"
@@ -9,11 +9,15 @@ var name: String
 var trigger_time: int
 var description: String
 
+# 类型标识符在构造时解析一次，执行事件和_to_string()时直接返回
+var _type_identifier: String
+
 func _init(p_id: String, p_name: String, p_description: String = ""):
     id = p_id
     name = p_name
     description = p_description
     trigger_time = 0
+    _type_identifier = get_script().get_global_name() if get_script() else "Schedulable"
 
 ## 抽象方法：执行调度逻辑
 ## 子类必须重写此方法实现具体的执行逻辑
@@ -33,8 +37,9 @@ func should_reschedule() -> bool:
     return false
 
 ## 获取类型标识符（用于调试和日志）
+## 默认为脚本的class_name，子类一般不需要重写
 func get_type_identifier() -> String:
-    return get_script().get_global_name() if get_script() else "Schedulable"
+    return _type_identifier
 
 func _to_string() -> String:
     return "%s [%s]" % [name, get_type_identifier()]
\ No newline at end of file
@@ -77,7 +77,7 @@ func add_animated_item(data: Variant, control_node: Control = null) -> AnimatedL
     item.target_position = Vector2(0, initial_y)
     
     # 调试信息
-    if not Engine.is_editor_hint():
+    if not Engine.is_editor_hint() and ConfigManager.debug_enable_logging:
         print("Added item at position: ", initial_y, " with size: ", item.size)
     
     return item
@@ -105,6 +105,9 @@ func update_target_positions_by_trigger_time():
     # 按trigger_time排序（从data中获取）
     items.sort_custom(_compare_by_trigger_time)
     
+    # 调试开关在循环外读取一次
+    var log_sizes = not Engine.is_editor_hint() and ConfigManager.debug_enable_logging
+    
     # 为每个项目分配新的目标位置
     for i in range(items.size()):
         var new_y = i * (item_height + item_spacing)
@@ -117,7 +120,7 @@ func update_target_positions_by_trigger_time():
         items[i].size.y = item_height
         
         # 调试信息
-        if not Engine.is_editor_hint():
+        if log_sizes:
             print("Updated item %d size to: %s" % [i, items[i].size])
 
 ## 比较函数：按trigger_time排序
@@ -196,44 +199,44 @@ func get_all_data() -> Array:
 
 ## 更新现有项目的数据（保持动画状态）
 func update_items_from_data(data_array: Array):
-    # 移除不再存在的项目
+    # 按匹配键建立索引，避免对每个项目逐一比较全部数据(O(n²))
+    var incoming_keys = {}
+    for data in data_array:
+        incoming_keys[_match_key(data)] = true
+
+    # 移除不再存在的项目，同时记录保留下来的项目
+    var existing_items = {}
     var items_to_remove = []
     for item in items:
-        var found = false
-        for data in data_array:
-            if _data_matches(item.get_data(), data):
-                found = true
-                break
-        if not found:
+        var key = _match_key(item.get_data())
+        if not incoming_keys.has(key):
             items_to_remove.append(item)
+        elif not existing_items.has(key):
+            existing_items[key] = item
     
     for item in items_to_remove:
-        remove_animated_item(item)
+        # 最后会统一更新位置，这里不逐个重新排序
+        items.erase(item)
+        remove_child(item)
+        item.queue_free()
     
     # 添加新项目或更新现有项目
     for data in data_array:
-        var existing_item = _find_item_by_matching_data(data)
+        var key = _match_key(data)
+        var existing_item = existing_items.get(key)
         if existing_item:
             # 更新现有项目的数据
             existing_item.set_data(data)
         else:
             # 添加新项目
-            add_animated_item(data)
+            existing_items[key] = add_animated_item(data)
     
     # 更新位置
     update_target_positions_by_trigger_time()
 
-## 检查两个数据是否匹配（通过key字段）
-func _data_matches(data1: Variant, data2: Variant) -> bool:
-    if typeof(data1) == TYPE_DICTIONARY and typeof(data2) == TYPE_DICTIONARY:
-        if "key" in data1 and "key" in data2:
-            return data1.key == data2.key
-    return data1 == data2
-
-## 通过匹配数据查找项目
-func _find_item_by_matching_data(target_data: Variant) -> AnimatedListItem:
-    for item in items:
-        if _data_matches(item.get_data(), target_data):
-            return item
-    return null
+## 返回用于匹配项目的键：带key字段的字典用key，否则用数据本身
+func _match_key(data: Variant) -> Variant:
+    if typeof(data) == TYPE_DICTIONARY and "key" in data:
+        return data.key
+    return data
 
@@ -41,8 +41,8 @@ func _init(time_wheel_size: int = 0):
     # 初始化日历
     calendar = Calendar.new()
 
-    # 初始化时间轮，使用日历的获取时间方法
-    time_wheel = IndexedTimeWheel.new(actual_size, calendar.get_timestamp)
+    # 初始化时间轮，使用日历的获取时间方法；游戏循环只在主线程运行，无需加锁
+    time_wheel = IndexedTimeWheel.new(actual_size, calendar.get_timestamp, false)
 
     # 初始化CTB管理器，连接到时间轮
     ctb_manager = CTBManager.new(
@@ -50,9 +50,11 @@ func _init(time_wheel_size: int = 0):
         _advance_time_callback,          # advance_time_callback
         _schedule_callback,              # schedule_callback
         _remove_callback,                # remove_callback
-        _peek_callback,                  # peek_callback
-        _pop_callback,                   # pop_callback
-        _is_slot_empty_callback          # is_slot_empty_callback
+        time_wheel.peek_upcoming_events, # peek_callback
+        time_wheel.pop_due_event,        # pop_callback
+        time_wheel._is_current_slot_empty, # is_slot_empty_callback
+        time_wheel.ticks_until_next_event, # next_event_delay_callback
+        _advance_hours                   # advance_time_by_callback
     )
 
     # 连接CTB管理器的事件执行回调
@@ -71,18 +73,8 @@ func _remove_callback(key: String) -> bool:
     var removed = time_wheel.remove(key)
     return removed != null
 
-func _peek_callback(count: int, max_hours: int) -> Array:
-    var upcoming = time_wheel.peek_upcoming_events(count, max_hours)
-    var result = []
-    for event_dict in upcoming:
-        result.append({"key": event_dict["key"], "value": event_dict["value"]})
-    return result
-
-func _pop_callback() -> Dictionary:
-    return time_wheel.pop_due_event()
-
-func _is_slot_empty_callback() -> bool:
-    return time_wheel._is_current_slot_empty()
+# peek/pop/is_slot_empty直接绑定时间轮的方法，不再经过一层转发函数；
+# 时间轮重建后需要重新绑定（见reset和clear_all_events）
 
 ## 事件执行回调
 func _on_event_executed(event) -> void:
@@ -114,25 +106,12 @@ var current_era_time: String:
 
 ## 推进时间（遇到事件时停下）
 func advance_time(hours: int) -> Dictionary:
-    var initial_time = current_time
-    var hours_advanced = 0
-    var stopped_for_event = false
-
-    for i in range(hours):
-        # 先检查当前槽是否有事件
-        if not time_wheel._is_current_slot_empty():
-            stopped_for_event = true
-            break
-
-        # 推进一小时
-        calendar.advance_time_tick()
-        time_wheel.advance_wheel()
-        hours_advanced += 1
-
-        # 推进后再次检查是否有新事件到期
-        if not time_wheel._is_current_slot_empty():
-            stopped_for_event = true
-            break
+    # 先查询下一个事件还有多少小时，再一次性推进，不逐小时循环
+    var next_delay = time_wheel.ticks_until_next_event()
+    # 推进0小时时与逐小时循环一致，不算遇到事件
+    var stopped_for_event = hours > 0 and next_delay != -1 and next_delay <= hours
+    var hours_advanced = next_delay if stopped_for_event else maxi(hours, 0)
+    _advance_hours(hours_advanced)
 
     if hours_advanced > 0:
         time_advanced.emit(hours_advanced)
@@ -153,21 +132,11 @@ func advance_time(hours: int) -> Dictionary:
 
 ## 推进到下一个事件（不执行事件）
 func advance_to_next_event(max_hours: int = 100) -> Dictionary:
-    var initial_time = current_time
-    var hours_advanced = 0
-    var found_event = false
-
     # 最多推进max_hours小时寻找事件
-    while hours_advanced < max_hours:
-        if not time_wheel._is_current_slot_empty():
-            # 找到事件，停止推进，不执行事件
-            found_event = true
-            break
-
-        # 推进一小时
-        calendar.advance_time_tick()
-        time_wheel.advance_wheel()
-        hours_advanced += 1
+    var next_delay = time_wheel.ticks_until_next_event()
+    var found_event = next_delay != -1 and next_delay < max_hours
+    var hours_advanced = next_delay if found_event else maxi(max_hours, 0)
+    _advance_hours(hours_advanced)
 
     if hours_advanced > 0:
         time_advanced.emit(hours_advanced)
@@ -179,21 +148,26 @@ func advance_to_next_event(max_hours: int = 100) -> Dictionary:
         "current_time": current_time
     }
 
+# 日历和时间轮一起批量推进，调用方需保证跳过的小时内没有事件
+func _advance_hours(hours: int) -> void:
+    if hours <= 0:
+        return
+    calendar.advance_time_ticks(hours)
+    time_wheel.advance_wheel_by(hours)
+
 ## 执行当前到期事件（不推进时间，一次只执行一个事件）
 func execute_due_event() -> Dictionary:
     var event_executed = ""
     var current_time = calendar.get_timestamp()
     var found_event = false
 
-    # 只执行当前槽的一个事件
-    if not time_wheel._is_current_slot_empty():
-        var event_data = time_wheel.pop_due_event()
-        if not event_data.is_empty():
-            var event = event_data["value"]
-            ctb_manager._execute_event(event)
-            event_executed = str(event)
-            found_event = true
-            systems_updated.emit()
+    # 只执行当前槽的一个事件；不需要key，直接取值，当前槽为空时返回null
+    var event = time_wheel.pop_due_value()
+    if event != null:
+        ctb_manager._execute_event(event, current_time)
+        event_executed = str(event)
+        found_event = true
+        systems_updated.emit()
 
     return {
         "event_executed": event_executed,
@@ -238,7 +212,7 @@ func reset() -> void:
     calendar.reset()
     # 重新初始化时间轮
     var buffer_size = time_wheel._buffer_size
-    time_wheel = IndexedTimeWheel.new(buffer_size, calendar.get_timestamp)
+    time_wheel = IndexedTimeWheel.new(buffer_size, calendar.get_timestamp, false)
 
     # 重新初始化CTB管理器
     ctb_manager = CTBManager.new(
@@ -246,9 +220,11 @@ func reset() -> void:
         _advance_time_callback,
         _schedule_callback,
         _remove_callback,
-        _peek_callback,
-        _pop_callback,
-        _is_slot_empty_callback
+        time_wheel.peek_upcoming_events,
+        time_wheel.pop_due_event,
+        time_wheel._is_current_slot_empty,
+        time_wheel.ticks_until_next_event,
+        _advance_hours
     )
     ctb_manager.on_event_executed = _on_event_executed
 
@@ -258,14 +234,15 @@ func reset() -> void:
 func clear_all_events() -> void:
     # 重新创建时间轮以清空所有事件
     var buffer_size = time_wheel._buffer_size
-    time_wheel = IndexedTimeWheel.new(buffer_size, calendar.get_timestamp)
+    time_wheel = IndexedTimeWheel.new(buffer_size, calendar.get_timestamp, false)
 
     # 重新连接CTB管理器
     ctb_manager._schedule_callback = _schedule_callback
     ctb_manager._remove_callback = _remove_callback
-    ctb_manager._peek_callback = _peek_callback
-    ctb_manager._pop_callback = _pop_callback
-    ctb_manager._is_slot_empty_callback = _is_slot_empty_callback
+    ctb_manager._peek_callback = time_wheel.peek_upcoming_events
+    ctb_manager._pop_callback = time_wheel.pop_due_event
+    ctb_manager._is_slot_empty_callback = time_wheel._is_current_slot_empty
+    ctb_manager._next_event_delay_callback = time_wheel.ticks_until_next_event
 
     systems_updated.emit()
 
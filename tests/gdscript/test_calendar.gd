@@ -22,27 +22,33 @@ func test_initial_state():
     assert_eq(info["month"], 1, "初始月份应该是1")
     assert_eq(info["day_in_month"], 1, "初始日期应该是1日")
 
-## 测试推进一整年
-func test_advance_one_year():
-    var initial_year = calendar.current_gregorian_year
-    # 推进360天 * 24小时 = 8640小时
-    for i in range(360 * 24):
-        calendar.advance_time_tick()
-    
-    assert_eq(calendar.current_gregorian_year, initial_year + 1, "推进一年后年份应该增加1")
-    var info = calendar.get_time_info()
-    assert_eq(info["month"], 1, "新年应该是1月")
-    assert_eq(info["day_in_month"], 1, "新年应该是1日")
+## 推进时间后的日期分解用例：[起始年份, 推进小时数, 结束年份, 年内天数, 月, 日, 日内小时]
+## 年份为360天，所以365天后是第2年第6天
+var advance_cases = [
+    [-2000, 360 * 24, -1999, 1, 1, 1, 0],
+    [-2000, 100 * 24 + 5, -2000, 101, 4, 11, 5],
+    [1, 365 * 24, 2, 6, 1, 6, 0],
+    [1, 0, 1, 1, 1, 1, 0],
+]
+
+## 测试从不同起始年份推进时间后的日期
+func test_advance_and_decompose(p = use_parameters(advance_cases)):
+    var cal = Calendar.new(p[0])
+    assert_eq(cal.current_gregorian_year, p[0], "应该从指定年份开始")
+    cal.advance_time_ticks(p[1])
+
+    assert_eq(cal.current_gregorian_year, p[2], "年份应该正确")
+    var info = cal.get_time_info()
+    assert_eq(info["day_in_year"], p[3], "年内天数应该正确")
+    assert_eq(info["month"], p[4], "月份应该正确")
+    assert_eq(info["day_in_month"], p[5], "日期应该正确")
+    assert_eq(info["hour_in_day"], p[6], "日内小时应该正确")
 
 ## 测试获取时间信息
 func test_get_time_info():
-    # 推进100天 * 24小时 = 2400小时
-    for i in range(100 * 24):
-        calendar.advance_time_tick()
-    # 推进5小时
-    for i in range(5):
-        calendar.advance_time_tick()
-    
+    # 推进100天 * 24小时 + 5小时 = 2405小时
+    calendar.advance_time_ticks(100 * 24 + 5)
+
     # 设置纪元锚点避免异常
     calendar.anchor_era("测试纪元", config_mock.time_epoch_start_year)
     var info = calendar.get_time_info()
@@ -56,8 +62,7 @@ func test_get_time_info():
 ## 测试重置功能
 func test_reset():
     # 推进100天 * 24小时 = 2400小时
-    for i in range(100 * 24):
-        calendar.advance_time_tick()
+    calendar.advance_time_ticks(100 * 24)
     
     calendar.reset()
     assert_eq(calendar.current_gregorian_year, config_mock.time_epoch_start_year, "重置后年份应该恢复")
@@ -69,8 +74,7 @@ func test_reset():
 ## 测试纪元锚点设置
 func test_era_anchor():
     # 简单推进几天测试锚定逻辑
-    for i in range(100):
-        calendar.advance_time_tick()
+    calendar.advance_time_ticks(100)
     
     # 设置锚点到当前时间之前的年份
     var current_year = calendar.current_gregorian_year
@@ -84,8 +88,7 @@ func test_era_anchor():
 ## 测试纪元锚点验证
 func test_era_anchor_validation():
     # 推进几天
-    for i in range(100):
-        calendar.advance_time_tick()
+    calendar.advance_time_ticks(100)
     
     # 测试锚定到未来年份应该失败（产生push_error）
     var current_year = calendar.current_gregorian_year
@@ -108,8 +111,7 @@ func test_format_gregorian():
 ## 测试纪年格式化
 func test_format_with_era():
     # 推进5天 * 24小时 + 5小时 = 125小时
-    for i in range(5 * 24 + 5):
-        calendar.advance_time_tick()
+    calendar.advance_time_ticks(5 * 24 + 5)
     
     # 设置锚点为当前年份（这样就是纪元元年）
     var current_year = calendar.current_gregorian_year
@@ -118,16 +120,77 @@ func test_format_with_era():
     var date_str = calendar.format_date_era(true)
     assert_eq(date_str, "开元1年1月6日5点", "纪年格式化应该正确")
 
-## 测试不同起始年份
-func test_different_start_year():
-    var calendar_ad = Calendar.new(1)
-    assert_eq(calendar_ad.current_gregorian_year, 1, "应该从公元1年开始")
-    
-    # 推进365天 * 24小时 = 8760小时
-    for i in range(365 * 24):
-        calendar_ad.advance_time_tick()
-    
-    # 我们的年份是360天，所以365天后是2年第6天
-    assert_eq(calendar_ad.current_gregorian_year, 2, "推进365天后应该是第2年")
-    var info = calendar_ad.get_time_info()
-    assert_eq(info["day_in_year"], 6, "应该是第6天")
+## 测试批量推进时间
+func test_advance_time_ticks():
+    var stepped = Calendar.new()
+    for i in range(37 * 24 + 5):
+        stepped.advance_time_tick()
+
+    calendar.advance_time_ticks(37 * 24 + 5)
+    assert_eq(calendar.get_timestamp(), stepped.get_timestamp(), "批量推进应与逐tick推进结果一致")
+    assert_eq(calendar.format_date_gregorian(true), stepped.format_date_gregorian(true), "日期应该一致")
+
+## 测试配置变更后重新分解日期
+func test_config_change_refreshes_date():
+    calendar.advance_time_ticks(36)
+    assert_eq(calendar.get_time_info()["hour_in_day"], 12, "每天24小时时应为12点")
+
+    # 直接注入配置值，不修改全局配置，也不向其他监听者发出config_changed
+    calendar._apply_time_config(12, config_mock.time_days_per_year)
+    var info = calendar.get_time_info()
+
+    assert_eq(calendar.hours_per_day, 12, "快照应使用新配置")
+    assert_eq(info["day_in_year"], 4, "每天12小时时36小时应为第4天")
+    assert_eq(info["hour_in_day"], 0, "每天12小时时应为0点")
+
+## 测试格式化文本缓存在时间或纪元变化后失效
+func test_formatted_text_cache_invalidation():
+    var before = calendar.format_date_era(true)
+    assert_eq(calendar.format_date_era(true), before, "时间未变时应返回相同文本")
+
+    calendar.start_new_era("开元")
+    var after_era = calendar.format_date_era(true)
+    assert_ne(after_era, before, "改元后纪年文本应更新")
+    assert_true(calendar.get_time_status_text().contains("开元"), "状态文本应包含新纪元")
+
+    calendar.advance_time_tick()
+    assert_eq(calendar.format_date_era(true), "开元1年1月1日1点", "推进时间后文本应更新")
+
+    calendar.reset()
+    assert_eq(calendar.format_date_era(true), before, "重置后应回到初始文本")
+
+## 测试字段访问器与get_time_info()一致
+func test_field_accessors():
+    calendar.advance_time_ticks(45 * 24 + 7)
+    calendar.start_new_era("开元")
+    calendar.advance_time_ticks(360 * 24)
+
+    var info = calendar.get_time_info()
+    assert_eq(calendar.current_month, info["month"], "月份应一致")
+    assert_eq(calendar.current_day_in_month, info["day_in_month"], "日期应一致")
+    assert_eq(calendar.current_day_in_year, info["day_in_year"], "年内天数应一致")
+    assert_eq(calendar.current_hour_in_day, info["hour_in_day"], "小时应一致")
+    assert_eq(calendar.current_era_name, info["current_era_name"], "纪元名应一致")
+    assert_eq(calendar.current_era_year, 2, "改元一年后应为纪元第2年")
+    assert_eq(calendar.current_anchor, info["current_anchor"], "锚定应一致")
+
+## 测试状态版本号
+func test_version_changes_on_mutation():
+    var version = calendar.get_version()
+    calendar.format_date_era(true)
+    calendar.get_time_info()
+    assert_eq(calendar.get_version(), version, "只读操作不应改变版本")
+
+    calendar.advance_time_tick()
+    assert_gt(calendar.get_version(), version, "推进时间后版本应变化")
+    version = calendar.get_version()
+
+    calendar.advance_time_ticks(0)
+    assert_eq(calendar.get_version(), version, "推进0小时不应改变版本")
+
+    calendar.start_new_era("开元")
+    assert_gt(calendar.get_version(), version, "改元后版本应变化")
+    version = calendar.get_version()
+
+    calendar.reset()
+    assert_gt(calendar.get_version(), version, "重置后版本应变化")
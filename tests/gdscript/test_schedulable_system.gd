@@ -172,6 +172,23 @@ func test_ctb_manager_process_turn():
     assert_true(result.has("schedulable_name"), "Result should have schedulable name")
     assert_true(result.has("ticks_advanced"), "Result should have ticks advanced")
 
+## 测试提供批量推进回调时一次跳到下一个事件
+func test_ctb_manager_process_turn_jumps_to_next_event():
+    var advance_calls = [0]
+    ctb_manager._next_event_delay_callback = time_wheel.ticks_until_next_event
+    ctb_manager._advance_time_by_callback = func(hours: int):
+        advance_calls[0] += 1
+        mock_calendar.current_time += hours
+        time_wheel.advance_wheel_by(hours)
+
+    var actor = EventExample.new("test_actor", "测试战士")
+    ctb_manager.schedule_with_delay("test_actor", actor, 500)
+    var result = ctb_manager.process_next_turn()
+
+    assert_eq(result["ticks_advanced"], 500, "应推进500小时")
+    assert_eq(result["timestamp"], 500, "事件应在500小时执行")
+    assert_eq(advance_calls[0], 1, "应只推进一次")
+
 ## 测试CTBManager基本调度功能
 func test_ctb_manager_basic_scheduling():
     var actor = EventExample.new("test_actor", "测试战士")
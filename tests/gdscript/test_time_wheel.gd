@@ -106,4 +106,198 @@ func test_remove_event():
     time_wheel.remove("actor1")
     assert_eq(time_wheel.get_count(), 0, "移除事件后应该没有事件")
 
-    # RefCounted对象自动管理内存
\ No newline at end of file
+    # RefCounted对象自动管理内存
+
+## 测试弹出和移除后可以用同一个键重新调度
+func test_reschedule_after_pop_and_remove():
+    # 弹出/移除后的节点会被回收复用，重新调度时数据不应串用
+    var actor1 = EventExample.new("test1", "角色1")
+    var actor2 = EventExample.new("test2", "角色2")
+    time_wheel.schedule_with_delay("actor1", actor1, 0)
+    time_wheel.schedule_with_delay("actor2", actor2, 200)  # 未来事件
+
+    var event = time_wheel.pop_due_event()
+    assert_eq(event["key"], "actor1", "应该弹出actor1")
+    assert_eq(event["value"], actor1, "弹出的值应该是actor1")
+    assert_eq(time_wheel.remove("actor2"), actor2, "移除应返回actor2")
+
+    time_wheel.schedule_with_delay("actor2", actor2, 0)
+    time_wheel.schedule_with_delay("actor1", actor1, 1)
+    assert_eq(time_wheel.get_event("actor1"), actor1, "复用节点后actor1的值应该正确")
+    assert_eq(time_wheel.get_event("actor2"), actor2, "复用节点后actor2的值应该正确")
+
+    event = time_wheel.pop_due_event()
+    assert_eq(event["key"], "actor2", "当前槽位应该只有actor2")
+    assert_true(time_wheel.pop_due_event().is_empty(), "当前槽位应该已空")
+
+## 测试非线程安全模式
+func test_single_threaded_wheel():
+    # 非线程安全模式下不创建Mutex，功能应与默认模式一致
+    var wheel = IndexedTimeWheel.new(10, func(): return 0, false)
+    var actor = EventExample.new("test1", "测试角色")
+    wheel.schedule_with_delay("actor1", actor, 0)
+    assert_true(wheel.contains("actor1"), "应该包含actor1")
+    assert_eq(wheel.get_count(), 1, "应该有1个事件")
+
+    var event = wheel.pop_due_event()
+    assert_eq(event["value"], actor, "应该弹出actor1")
+    assert_false(wheel.has_any_events(), "弹出后不应该有事件")
+
+## 测试距下一个事件的小时数
+func test_ticks_until_next_event():
+    var now = [0]
+    var wheel = IndexedTimeWheel.new(10, func(): return now[0])
+    assert_eq(wheel.ticks_until_next_event(), -1, "没有事件时应返回-1")
+
+    wheel.schedule_with_delay("far", EventExample.new("far", "远期角色"), 25)  # 未来事件
+    assert_eq(wheel.ticks_until_next_event(), 25, "只有未来事件时应返回其延迟")
+
+    wheel.schedule_with_delay("near", EventExample.new("near", "近期角色"), 4)
+    assert_eq(wheel.ticks_until_next_event(), 4, "应返回最近的时间轮事件")
+
+    # 移除后槽位清空，位图中对应位被清零
+    wheel.remove("near")
+    assert_eq(wheel.ticks_until_next_event(), 25, "移除近期事件后应回到未来事件")
+
+    wheel.schedule_with_delay("now", EventExample.new("now", "当前角色"), 0)
+    assert_eq(wheel.ticks_until_next_event(), 0, "当前槽有事件时应返回0")
+    wheel.pop_due_event()
+
+    # 推进时间后延迟应随之减少
+    for i in range(3):
+        now[0] += 1
+        wheel.advance_wheel()
+    assert_eq(wheel.ticks_until_next_event(), 22, "推进3小时后应剩22小时")
+
+## 测试跨位图字和绕回时查找下一个事件
+func test_ticks_until_next_event_across_bitmap_words():
+    var now = [0]
+    var wheel = IndexedTimeWheel.new(256, func(): return now[0])
+    wheel.schedule_with_delay("a", EventExample.new("a", "角色A"), 63)
+    wheel.schedule_with_delay("b", EventExample.new("b", "角色B"), 64)
+    wheel.schedule_with_delay("c", EventExample.new("c", "角色C"), 200)
+    assert_eq(wheel.ticks_until_next_event(), 63, "应找到第一个字最高位上的事件")
+
+    wheel.remove("a")
+    assert_eq(wheel.ticks_until_next_event(), 64, "应跨字找到下一个事件")
+    wheel.remove("b")
+    assert_eq(wheel.ticks_until_next_event(), 200, "应跳过空字找到事件")
+
+    # 推进到靠近末尾，新事件绕回到位图开头的槽位
+    now[0] += 200
+    wheel.advance_wheel_by(200)
+    wheel.pop_due_event()
+    wheel.schedule_with_delay("d", EventExample.new("d", "角色D"), 100)
+    assert_eq(wheel.ticks_until_next_event(), 100, "绕回后的槽位应得到正确的延迟")
+
+## 测试非2的幂大小的时间轮下标绕回
+func test_non_power_of_two_size_wraps_around():
+    # 10不是2的幂，槽位数应保持为10，下标用取模绕回
+    var now = [0]
+    var wheel = IndexedTimeWheel.new(10, func(): return now[0])
+    assert_eq(wheel._buffer_size, 10, "不应把槽位数向上取整")
+
+    now[0] += 8
+    wheel.advance_wheel_by(8)
+    wheel.schedule_with_delay("wrap", EventExample.new("wrap", "绕回角色"), 5)
+    wheel.schedule_with_delay("far", EventExample.new("far", "远期角色"), 12)  # 未来事件
+    assert_eq(wheel.ticks_until_next_event(), 5, "绕回到开头槽位的事件应得到正确延迟")
+
+    now[0] += 5
+    wheel.advance_wheel_by(5)
+    assert_eq(wheel.pop_due_event()["key"], "wrap", "绕回后应弹出wrap")
+    assert_eq(wheel.ticks_until_next_event(), 7, "迁入的未来事件应在7小时后")
+
+## 测试未来事件序号重新编号后保持顺序
+func test_future_seq_rebase_keeps_order():
+    var now = [0]
+    var wheel = IndexedTimeWheel.new(4, func(): return now[0])
+    # 模拟序号即将用尽：下一次插入前应重新编号，而不是溢出到小时位
+    wheel._future_seq = (1 << 32) - 1
+    wheel.schedule_with_delay("actor1", EventExample.new("test1", "角色1"), 6)
+    wheel.schedule_with_delay("removed", EventExample.new("removed", "被移除"), 6)
+    wheel.remove("removed")
+    wheel.schedule_with_delay("actor2", EventExample.new("test2", "角色2"), 6)
+    wheel.schedule_with_delay("actor3", EventExample.new("test3", "角色3"), 5)
+    assert_lt(wheel._future_seq, 1 << 32, "重新编号后序号应回到32位范围内")
+
+    var popped = []
+    for i in range(8):
+        var event = wheel.pop_due_event()
+        while not event.is_empty():
+            popped.append([now[0], event["key"]])
+            event = wheel.pop_due_event()
+        now[0] += 1
+        wheel.advance_wheel()
+
+    assert_eq(popped, [[5, "actor3"], [6, "actor1"], [6, "actor2"]], "重新编号后应保持时间和调度顺序")
+
+## 测试只弹出事件值
+func test_pop_due_value():
+    var actor1 = EventExample.new("test1", "角色1")
+    var actor2 = EventExample.new("test2", "角色2")
+    time_wheel.schedule_with_delay("actor1", actor1, 0)
+    time_wheel.schedule_with_delay("actor2", actor2, 0)
+
+    assert_eq(time_wheel.pop_due_value(), actor1, "应该按调度顺序返回值")
+    assert_false(time_wheel.contains("actor1"), "弹出的事件应该从索引中移除")
+    assert_eq(time_wheel.pop_due_value(), actor2, "应该返回第二个事件的值")
+    assert_null(time_wheel.pop_due_value(), "当前槽位为空时应返回null")
+    assert_eq(time_wheel.get_count(), 0, "不应再有事件")
+
+## 测试未来事件的到期顺序和删除
+func test_future_events_order_and_removal():
+    var now = [0]
+    var wheel = IndexedTimeWheel.new(4, func(): return now[0])
+    var actor1 = EventExample.new("test1", "角色1")
+    var actor2 = EventExample.new("test2", "角色2")
+    var actor3 = EventExample.new("test3", "角色3")
+    # 都超出4个槽位，进入未来事件堆；同一小时的事件应保持调度顺序
+    wheel.schedule_with_delay("actor3", actor3, 9)
+    wheel.schedule_with_delay("actor1", actor1, 6)
+    wheel.schedule_with_delay("actor2", actor2, 6)
+    wheel.schedule_with_delay("removed", EventExample.new("removed", "被移除"), 6)
+    wheel.remove("removed")
+    assert_eq(wheel.get_count(), 3, "移除后应剩3个事件")
+
+    var popped = []
+    for i in range(10):
+        var event = wheel.pop_due_event()
+        while not event.is_empty():
+            popped.append([now[0], event["key"]])
+            event = wheel.pop_due_event()
+        now[0] += 1
+        wheel.advance_wheel()
+
+    assert_eq(popped, [[6, "actor1"], [6, "actor2"], [9, "actor3"]], "未来事件应按时间和调度顺序到期，已移除的不应出现")
+    assert_false(wheel.has_any_events(), "所有事件都应已弹出")
+
+## 测试一次推进多个小时
+func test_advance_wheel_by():
+    var now = [0]
+    var wheel = IndexedTimeWheel.new(8, func(): return now[0])
+    wheel.schedule_with_delay("near", EventExample.new("near", "近期角色"), 5)
+    wheel.schedule_with_delay("far1", EventExample.new("far1", "远期角色1"), 14)  # 未来事件
+    wheel.schedule_with_delay("far2", EventExample.new("far2", "远期角色2"), 17)  # 未来事件
+
+    # 一次跳到第一个事件
+    var delay = wheel.ticks_until_next_event()
+    assert_eq(delay, 5, "下一个事件应在5小时后")
+    now[0] += delay
+    wheel.advance_wheel_by(delay)
+    assert_eq(wheel.pop_due_event()["key"], "near", "批量推进后应弹出near")
+
+    # 一次跳过多个小时，多个未来事件应迁入各自正确的槽位
+    delay = wheel.ticks_until_next_event()
+    assert_eq(delay, 9, "far1应在9小时后")
+    now[0] += delay
+    wheel.advance_wheel_by(delay)
+    assert_eq(wheel.pop_due_event()["key"], "far1", "应弹出far1")
+    assert_eq(wheel.ticks_until_next_event(), 3, "far2应在3小时后")
+
+    # 跳过尚未执行的事件应被拒绝（产生push_error），状态不变
+    now[0] += 5
+    wheel.advance_wheel_by(5)
+    now[0] -= 5
+    assert_eq(wheel.ticks_until_next_event(), 3, "拒绝后far2仍应在3小时后")
+    assert_true(wheel.pop_due_event().is_empty(), "拒绝后当前槽位应仍为空")